@@ -40,6 +40,13 @@ DEFAULT_INITIAL_URL = "https://www.google.com"
 # Default timeout for Playwright operations (milliseconds)
 DEFAULT_TIMEOUT_MS = 3000
 
+# Maximum wait for a response from the browser worker thread (seconds)
+BROWSER_RESPONSE_TIMEOUT_SEC = 30
+
+# Bedrock inference latency mode ("standard" or "optimized")
+# "optimized" is only available for some models and regions
+PERFORMANCE_LATENCY = "standard"
+
 # ---------------------------------------------------------------------------
 # Execution wrapper
 # ---------------------------------------------------------------------------
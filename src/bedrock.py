@@ -8,6 +8,7 @@ This module provides:
 - API response analysis
 """
 
+import functools
 import logging
 from typing import Any
 
@@ -19,8 +20,13 @@ from .utils import add_debug_log, log_json_debug
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
 def get_inference_config(model_id: str) -> dict[str, Any]:
-    """Return optimal inference parameters for each model"""
+    """Return optimal inference parameters for each model
+
+    The result is cached per model ID and shared between callers, so it must
+    not be modified.
+    """
     cfg = {"maxTokens": 3000}
 
     if "amazon.nova" in model_id:
@@ -34,11 +40,11 @@ def update_token_usage(
     response: dict[str, Any], token_usage: dict[str, int]
 ) -> dict[str, int]:
     """Update token usage statistics"""
-    usage = response.get("usage", {})
+    usage = response.get("usage") or {}
     token_usage["inputTokens"] += usage.get("inputTokens", 0)
     token_usage["outputTokens"] += usage.get("outputTokens", 0)
-    token_usage["totalTokens"] += usage.get("inputTokens", 0) + usage.get(
-        "outputTokens", 0
+    token_usage["totalTokens"] = (
+        token_usage["inputTokens"] + token_usage["outputTokens"]
     )
     return token_usage
 
@@ -49,6 +55,7 @@ def call_bedrock_api(
     system_prompt: str,
     model_id: str,
     tool_config: dict[str, Any],
+    performance_config: dict[str, str] | None = None,
 ) -> dict[str, Any]:
     """Call Bedrock API to get LLM response
 
@@ -58,6 +65,7 @@ def call_bedrock_api(
         system_prompt: System prompt
         model_id: Model ID to use
         tool_config: Tool configuration
+        performance_config: Optional performanceConfig (e.g. {"latency": "optimized"})
 
     Returns:
         API response
@@ -71,6 +79,8 @@ def call_bedrock_api(
             "inferenceConfig": inference_config,
             "toolConfig": tool_config,
         }
+        if performance_config:
+            request_params["performanceConfig"] = performance_config
         log_json_debug("Bedrock Request", request_params, level="DEBUG")
         response = bedrock_runtime.converse(**request_params)
         log_json_debug("Bedrock Response", response, level="DEBUG")
@@ -10,13 +10,14 @@ This package includes the following modules:
 
 from .actions import (cleanup_browser, click_element, get_aria_snapshot,
                       get_current_url, goto_url, initialize_browser,
-                      input_text, save_cookies)
+                      input_text, save_cookies, wait_for_navigation)
 from .utils import get_screen_size, is_headless
 
 __all__: list[str] = [
     "initialize_browser",
     "get_aria_snapshot",
     "goto_url",
+    "wait_for_navigation",
     "click_element",
     "input_text",
     "get_current_url",
@@ -8,6 +8,7 @@ A module that provides browser worker thread initialization and high-level APIs
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import logging
 import os
@@ -28,10 +29,28 @@ logger = logging.getLogger(__name__)
 # Global queue/thread management
 # ---------------------------------------------------------------------------
 
-_cmd_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+# The command queue lives on the worker's event loop and is fed through
+# call_soon_threadsafe, so an idle worker sleeps in its (daemon) thread
+# without blocking interpreter exit. Each worker gets a fresh queue, so
+# commands sent to a dead worker are never replayed by the next one.
+_cmd_queue: "asyncio.Queue[Dict[str, Any]] | None" = None
+_worker_loop: asyncio.AbstractEventLoop | None = None
 _res_queue: "queue.Queue[Dict[str, Any]]" = queue.Queue()
 _thread_started: bool = False
 _browser_thread: threading.Thread | None = None
+# Serializes worker startup and request/response round-trips across threads
+_init_lock = threading.Lock()
+_cmd_lock = threading.Lock()
+# Every command carries a request_id that the worker echoes in its response,
+# so responses that arrive after their caller timed out can be discarded
+_request_ids = itertools.count(1)
+_current_request_id: int | None = None
+# Set by the worker once the browser is ready (or failed to start). Every
+# worker gets its own Event, so a worker that is still shutting down cannot
+# signal the one started after it; _worker_error is only written by the
+# worker whose Event is not yet set.
+_worker_ready = threading.Event()
+_worker_error: str | None = None
 
 # Fallback for Playwright's TimeoutError (for import failure)
 try:
@@ -53,19 +72,43 @@ Page = Any  # 型エイリアス
 def initialize_browser() -> Dict[str, str]:
     """Initializes and starts the browser worker thread"""
 
-    global _thread_started, _browser_thread
+    global _thread_started, _browser_thread, _worker_ready, _worker_error
 
-    if _thread_started:
-        add_debug_log("initialize_browser: Thread is already started")
-        return {
-            "status": "success",
-            "message": "Browser worker is already initialized",
-        }
+    with _init_lock:
+        if _thread_started and _worker_ready.is_set():
+            add_debug_log("initialize_browser: Thread is already started")
+            return {
+                "status": "success",
+                "message": "Browser worker is already initialized",
+            }
 
-    add_debug_log("initialize_browser: Starting browser worker thread")
-    _browser_thread = threading.Thread(target=_worker_thread, daemon=True)
-    _browser_thread.start()
-    _thread_started = True
+        if _thread_started:
+            # A previous call timed out while the worker was still starting:
+            # keep waiting for it rather than launching a second browser
+            add_debug_log("initialize_browser: Waiting for the starting worker thread")
+        else:
+            add_debug_log("initialize_browser: Starting browser worker thread")
+            _worker_ready = threading.Event()
+            _worker_error = None
+            _browser_thread = threading.Thread(
+                target=_worker_thread, args=(_worker_ready,), daemon=True
+            )
+            _browser_thread.start()
+            _thread_started = True
+
+        # Wait for the launch instead of letting the first command absorb it,
+        # so startup failures are reported here
+        timeout = getattr(constants, 'BROWSER_RESPONSE_TIMEOUT_SEC', 30)
+        if not _worker_ready.wait(timeout=timeout):
+            add_debug_log("initialize_browser: Browser startup timed out", level="ERROR")
+            return {"status": "error", "message": "Browser startup timed out"}
+        if _worker_error:
+            _thread_started = False
+            add_debug_log(
+                f"initialize_browser: Browser startup failed: {_worker_error}",
+                level="ERROR",
+            )
+            return {"status": "error", "message": _worker_error}
 
     add_debug_log("initialize_browser: Browser worker thread started successfully")
     return {"status": "success", "message": "Browser worker initialized"}
@@ -75,21 +118,15 @@ def get_aria_snapshot() -> Dict[str, Any]:
     """Gets ARIA Snapshot information from the browser worker thread"""
 
     add_debug_log("browser.get_aria_snapshot: Sending ARIA snapshot request")
-    _ensure_worker_initialized()
-    _cmd_queue.put({"command": "get_aria_snapshot"})
-
     try:
-        res = _res_queue.get()
+        res = _send_command({"command": "get_aria_snapshot"})
         add_debug_log(f"browser.get_aria_snapshot: Response received status={res.get('status')}")
 
         if res.get("status") == "success":
-            raw_snapshot = res.get("aria_snapshot", [])
-            filtered_snapshot = [
-                e for e in raw_snapshot if e.get("role") in constants.ALLOWED_ROLES
-            ]
+            # Already filtered by ALLOWED_ROLES in the worker
             return {
                 "status": "success",
-                "aria_snapshot": filtered_snapshot,
+                "aria_snapshot": res.get("aria_snapshot", []),
                 "message": res.get("message", "ARIA Snapshot retrieved successfully"),
             }
         error_msg = res.get("message", "Unknown error")
@@ -112,11 +149,8 @@ def goto_url(url: str) -> Dict[str, Any]:
     """Navigates to the specified URL"""
 
     add_debug_log(f"browser.goto_url: Navigate to URL: {url}", level="DEBUG")
-    _ensure_worker_initialized()
-    _cmd_queue.put({"command": "goto", "params": {"url": url}})
-
     try:
-        res = _res_queue.get()
+        res = _send_command({"command": "goto", "params": {"url": url}})
         add_debug_log(f"browser.goto_url: Response received: {res}", level="DEBUG")
         return res
     except queue.Empty:
@@ -124,6 +158,36 @@ def goto_url(url: str) -> Dict[str, Any]:
         return {"status": "error", "message": "Timeout (no response)"}
 
 
+def wait_for_navigation(from_url: str, timeout_ms: int | None = None) -> Dict[str, Any]:
+    """Waits until the page has navigated away from ``from_url`` and loaded
+
+    Use after a click or Enter that is expected to open another page; the
+    result carries the new ``url``. Returns immediately if the URL already
+    changed.
+
+    Args:
+        from_url: URL of the page before the operation
+        timeout_ms: Maximum wait in milliseconds (defaults to DEFAULT_TIMEOUT_MS)
+    """
+
+    add_debug_log(f"browser.wait_for_navigation: Waiting to leave {from_url}", level="DEBUG")
+    try:
+        res = _send_command(
+            {
+                "command": "wait_for_navigation",
+                "params": {"from_url": from_url, "timeout_ms": timeout_ms},
+            }
+        )
+        add_debug_log(
+            f"browser.wait_for_navigation: Response received status={res.get('status')}",
+            level="DEBUG",
+        )
+        return res
+    except queue.Empty:
+        add_debug_log("browser.wait_for_navigation: Timeout", level="ERROR")
+        return {"status": "error", "message": "Timeout (no response)"}
+
+
 def click_element(ref_id: int) -> Dict[str, Any]:
     """Clicks the specified element (ref_id)"""
 
@@ -132,13 +196,12 @@ def click_element(ref_id: int) -> Dict[str, Any]:
         return {"status": "error", "message": "ref_id is required to identify the element"}
 
     add_debug_log(f"browser.click_element: Clicking element with ref_id={ref_id}")
-    _ensure_worker_initialized()
-    _cmd_queue.put({"command": "click_element", "params": {"ref_id": ref_id}})
-
     try:
-        res = _res_queue.get()
+        res = _send_command({"command": "click_element", "params": {"ref_id": ref_id}})
         add_debug_log(f"browser.click_element: Response received status={res.get('status')}")
-        _append_snapshot_to_response(res)
+        # The worker normally attaches the snapshot itself
+        if "aria_snapshot" not in res:
+            _append_snapshot_to_response(res)
 
         # Log errors at INFO level
         if res.get("status") != "success":
@@ -174,15 +237,14 @@ def input_text(text: str, ref_id: int) -> Dict[str, Any]:
         return {"status": "error", "message": "Text to input is required"}
 
     add_debug_log(f"browser.input_text: Inputting text '{text}' to ref_id={ref_id}")
-    _ensure_worker_initialized()
-    _cmd_queue.put(
-        {"command": "input_text", "params": {"text": text, "ref_id": ref_id}}
-    )
-
     try:
-        res = _res_queue.get()
+        res = _send_command(
+            {"command": "input_text", "params": {"text": text, "ref_id": ref_id}}
+        )
         add_debug_log(f"browser.input_text: Response received status={res.get('status')}")
-        _append_snapshot_to_response(res)
+        # The worker normally attaches the snapshot itself
+        if "aria_snapshot" not in res:
+            _append_snapshot_to_response(res)
 
         # Log errors at INFO level
         if res.get("status") != "success":
@@ -214,10 +276,8 @@ def get_current_url() -> str:
     """Gets the URL of the currently displayed page"""
 
     add_debug_log("browser.get_current_url: Getting current URL")
-    _ensure_worker_initialized()
-    _cmd_queue.put({"command": "get_current_url"})
     try:
-        res = _res_queue.get()
+        res = _send_command({"command": "get_current_url"})
         add_debug_log(f"browser.get_current_url: Response received status={res.get('status')}")
         return res.get("url", "") if res.get("status") == "success" else ""
     except queue.Empty:
@@ -229,10 +289,8 @@ def save_cookies() -> Dict[str, Any]:
     """Saves cookies from the current browser session"""
 
     add_debug_log("browser.save_cookies: Saving cookies")
-    _ensure_worker_initialized()
-    _cmd_queue.put({"command": "save_cookies"})
     try:
-        res = _res_queue.get()
+        res = _send_command({"command": "save_cookies"})
         add_debug_log(f"browser.save_cookies: Response received status={res.get('status')}")
         return res
     except queue.Empty:
@@ -251,13 +309,14 @@ def take_screenshot(filepath: str = None, full_page: bool = True) -> Dict[str, A
         Dict with status, message, and filepath
     """
     add_debug_log(f"browser.take_screenshot: Taking screenshot, filepath={filepath}")
-    _ensure_worker_initialized()
-    _cmd_queue.put({
-        "command": "take_screenshot", 
-        "params": {"filepath": filepath, "full_page": full_page}
-    })
     try:
-        res = _res_queue.get(timeout=30)
+        res = _send_command(
+            {
+                "command": "take_screenshot",
+                "params": {"filepath": filepath, "full_page": full_page},
+            },
+            timeout=30,
+        )
         add_debug_log(f"browser.take_screenshot: Response received status={res.get('status')}")
         return res
     except queue.Empty:
@@ -266,14 +325,21 @@ def take_screenshot(filepath: str = None, full_page: bool = True) -> Dict[str, A
 
 
 def cleanup_browser() -> Dict[str, Any]:
-    """Closes the browser"""
+    """Closes the browser (no-op if the worker thread is not running)"""
+
+    global _thread_started
+
+    # Avoid starting a browser only to close it again on repeated calls
+    if not _thread_started:
+        add_debug_log("browser.cleanup_browser: Browser is not running")
+        return {"status": "success", "message": "Browser is not running"}
 
     add_debug_log("browser.cleanup_browser: Closing browser")
-    _ensure_worker_initialized()
-    _cmd_queue.put({"command": "quit"})
     try:
-        res = _res_queue.get(timeout=5)
+        res = _send_command({"command": "quit"}, timeout=5)
         add_debug_log(f"browser.cleanup_browser: Response received status={res.get('status')}")
+        if res.get("status") == "success":
+            _thread_started = False
         return res
     except queue.Empty:
         add_debug_log("browser.cleanup_browser: Timeout - forcing termination")
@@ -302,10 +368,62 @@ def _append_snapshot_to_response(res: Dict[str, Any]) -> None:
         )
 
 
+def _send_command(
+    cmd: Dict[str, Any], timeout: float | None = None
+) -> Dict[str, Any]:
+    """Sends a command to the worker thread and waits for its response
+
+    The request/response pair is handled under a lock so that callers on
+    different threads never receive each other's responses. Late responses
+    to earlier commands (whose callers already timed out) are dropped by
+    request_id. Raises ``queue.Empty`` if ``timeout`` (default:
+    ``BROWSER_RESPONSE_TIMEOUT_SEC``) elapses without a response.
+    """
+
+    if timeout is None:
+        timeout = getattr(constants, 'BROWSER_RESPONSE_TIMEOUT_SEC', 30)
+    # Report startup failures right away instead of queueing a command that
+    # no worker will answer
+    init_res = _ensure_worker_initialized()
+    if init_res.get("status") != "success":
+        return init_res
+    request_id = next(_request_ids)
+    with _cmd_lock:
+        if not _submit_command({**cmd, "request_id": request_id}):
+            return {"status": "error", "message": "Browser worker is not running"}
+        while True:
+            res = _res_queue.get(timeout=timeout)
+            res_id = res.pop("request_id", None)
+            if res_id in (None, request_id):
+                return res
+            add_debug_log(
+                f"browser._send_command: Dropping stale response (request_id={res_id})",
+                level="WARNING",
+            )
+
+
+def _submit_command(cmd: Dict[str, Any]) -> bool:
+    """Hands ``cmd`` to the worker's event loop (False if the worker is gone)"""
+
+    global _thread_started
+
+    loop, cmd_queue = _worker_loop, _cmd_queue
+    if loop is not None and cmd_queue is not None:
+        try:
+            loop.call_soon_threadsafe(cmd_queue.put_nowait, cmd)
+            return True
+        except RuntimeError:  # event loop already closed
+            pass
+    # The worker has exited: let the next command start a new one
+    add_debug_log("browser._submit_command: Worker is not running", level="ERROR")
+    _thread_started = False
+    return False
+
+
 def _ensure_worker_initialized() -> Dict[str, str]:
     """Ensures the worker thread is initialized"""
 
-    if not _thread_started:
+    if not (_thread_started and _worker_ready.is_set()):
         return initialize_browser()
     return {"status": "success", "message": "Browser worker is already initialized"}
 
@@ -315,17 +433,99 @@ def _ensure_worker_initialized() -> Dict[str, str]:
 # ---------------------------------------------------------------------------
 
 
-def _worker_thread() -> None:
-    """Main thread process for browser worker (synchronous wrapper)"""
+def _worker_thread(ready: threading.Event) -> None:
+    """Main thread process for browser worker (synchronous wrapper)
+
+    ``ready`` is this worker's own startup Event (see ``initialize_browser``).
+    """
+
+    global _worker_error
 
     add_debug_log("Worker thread: Thread started")
-    asyncio.run(_async_worker())
+    try:
+        asyncio.run(_async_worker(ready))
+    except Exception as e:
+        add_debug_log(f"Worker thread: Worker stopped with error: {e}", level="ERROR")
+        if not ready.is_set():
+            _worker_error = f"Browser startup failed: {e}"
+    finally:
+        # Never leave initialize_browser waiting on a dead worker
+        ready.set()
     add_debug_log("Worker thread: Thread ended")
 
 
-async def _async_worker() -> None:  # noqa: C901
+def _put_response(res: Dict[str, Any]) -> None:
+    """Puts ``res`` on the response queue tagged with the current request_id"""
+
+    if _current_request_id is not None:
+        res["request_id"] = _current_request_id
+    _res_queue.put(res)
+
+
+async def _snapshot_response(page: Page) -> Dict[str, Any]:
+    """Builds the ``get_aria_snapshot`` response for the current page
+
+    Shared by ``get_aria_snapshot`` and the snapshot attached to click/input
+    responses, so both only contain ``ALLOWED_ROLES`` elements.
+    """
+
+    try:
+        timeout_ms = getattr(constants, 'DEFAULT_TIMEOUT_MS', 3000)
+        await page.wait_for_load_state("domcontentloaded", timeout=timeout_ms)
+        snap_result = await snapshot_mod.get_snapshot_with_stats(page)
+        snapshot_data = [
+            e
+            for e in snap_result.get("snapshot", [])
+            if e.get("role") in constants.ALLOWED_ROLES
+        ]
+        error_count = snap_result.get("errorCount", 0)
+        process_error = snap_result.get("error")
+
+        if process_error:
+            add_debug_log(
+                f"Worker thread: Error during JavaScript execution: {process_error}"
+            )
+        if error_count > 0:
+            add_debug_log(
+                f"Worker thread: {error_count} element processing errors occurred during snapshot retrieval."
+            )
+
+        return {
+            "status": "success",
+            "message": f"ARIA Snapshot retrieved successfully ({len(snapshot_data)} elements, {error_count} errors)",
+            "aria_snapshot": snapshot_data,
+        }
+    except PlaywrightTimeoutError as e:
+        current_url = page.url if hasattr(page, "url") else "unknown"
+        error_msg = f"ARIA Snapshot retrieval error: {e}"
+        add_debug_log(f"Worker thread: {error_msg} (URL: {current_url})")
+        return {"status": "error", "message": error_msg}
+
+
+async def _put_with_snapshot(page: Page, res: Dict[str, Any]) -> None:
+    """Puts ``res`` on the response queue with the current ARIA Snapshot attached
+
+    Saves click/input callers a separate ``get_aria_snapshot`` round-trip.
+    """
+
+    try:
+        snap_res = await _snapshot_response(page)
+        res["aria_snapshot"] = snap_res.get("aria_snapshot", [])
+        if snap_res.get("status") != "success":
+            res["aria_snapshot_message"] = snap_res.get(
+                "message", "ARIA Snapshot retrieval failed"
+            )
+    except Exception as e:  # pragma: no cover
+        add_debug_log(f"Worker thread: Failed to attach snapshot: {e}", level="ERROR")
+    _put_response(res)
+
+
+async def _async_worker(ready: threading.Event) -> None:  # noqa: C901
     """Operates Playwright directly as an asynchronous worker thread"""
 
+    global _current_request_id, _worker_error, _cmd_queue, _worker_loop
+    _current_request_id = None
+
     add_debug_log("Worker thread: Asynchronous browser worker started")
 
     screen_width, screen_height = get_screen_size()
@@ -336,9 +536,8 @@ async def _async_worker() -> None:  # noqa: C901
         add_debug_log(
             "Worker thread: Failed to import Playwright", level="ERROR"
         )
-        _res_queue.put(
-            {"status": "error", "message": "Failed to import Playwright"}
-        )
+        _worker_error = "Failed to import Playwright"
+        ready.set()
         return
 
     playwright = await async_playwright().start()
@@ -401,17 +600,25 @@ async def _async_worker() -> None:  # noqa: C901
             f"Worker thread: Unexpected error occurred while loading initial page: {e}"
         )
 
+    add_debug_log("Worker thread: Browser ready")
+    cmd_queue = _cmd_queue = asyncio.Queue()
+    _worker_loop = asyncio.get_running_loop()
+    ready.set()
+
     # Command loop
     while True:
         try:
-            cmd = _cmd_queue.get(block=False)
+            # Woken by _submit_command as soon as a command is queued, while
+            # the event loop keeps serving Playwright
+            cmd = await cmd_queue.get()
+            _current_request_id = cmd.get("request_id")
             command = cmd.get("command")
             params = cmd.get("params", {})
 
             # Termination process ---------------------------------------------
             if command == "quit":
                 add_debug_log("Worker thread: Received quit command")
-                _res_queue.put(
+                _put_response(
                     {"status": "success", "message": "Browser closed"}
                 )
                 break
@@ -419,44 +626,15 @@ async def _async_worker() -> None:  # noqa: C901
             # ARIA Snapshot ----------------------------------------------------
             elif command == "get_aria_snapshot":
                 add_debug_log("Worker thread: Get ARIA Snapshot")
-                try:
-                    timeout_ms = getattr(constants, 'DEFAULT_TIMEOUT_MS', 3000)
-                    await page.wait_for_load_state(
-                        "domcontentloaded", timeout=timeout_ms
-                    )
-                    snap_result = await snapshot_mod.get_snapshot_with_stats(page)
-                    snapshot_data = snap_result.get("snapshot", [])
-                    error_count = snap_result.get("errorCount", 0)
-                    process_error = snap_result.get("error")
-
-                    if process_error:
-                        add_debug_log(
-                            f"Worker thread: Error during JavaScript execution: {process_error}"
-                        )
-                    if error_count > 0:
-                        add_debug_log(
-                            f"Worker thread: {error_count} element processing errors occurred during snapshot retrieval."
-                        )
-
-                    _res_queue.put(
-                        {
-                            "status": "success",
-                            "message": f"ARIA Snapshot retrieved successfully ({len(snapshot_data)} elements, {error_count} errors)",
-                            "aria_snapshot": snapshot_data,
-                        }
-                    )
-                except PlaywrightTimeoutError as e:
-                    current_url = page.url if hasattr(page, "url") else "unknown"
-                    error_msg = f"ARIA Snapshot retrieval error: {e}"
-                    add_debug_log(f"Worker thread: {error_msg} (URL: {current_url})")
-                    _res_queue.put({"status": "error", "message": error_msg})
+                _put_response(await _snapshot_response(page))
 
             # Element click ----------------------------------------------------
             elif command == "click_element":
                 ref_id = params.get("ref_id")
                 add_debug_log(f"Worker thread: Element click (ref_id): {ref_id}")
                 if ref_id is None:
-                    _res_queue.put(
+                    await _put_with_snapshot(
+                        page,
                         {
                             "status": "error",
                             "message": "ref_id is required to identify the element",
@@ -482,13 +660,8 @@ async def _async_worker() -> None:  # noqa: C901
                         log_operation_error(
                             "click_element", error_msg, {"ref_id": ref_id}
                         )
-                        snapshot_list = await snapshot_mod.take_aria_snapshot(page)
-                        _res_queue.put(
-                            {
-                                "status": "error",
-                                "message": error_msg,
-                                "aria_snapshot": snapshot_list,
-                            }
+                        await _put_with_snapshot(
+                            page, {"status": "error", "message": error_msg}
                         )
                         continue
                     except Exception:
@@ -497,7 +670,8 @@ async def _async_worker() -> None:  # noqa: C901
                         await locator.click(
                             force=True, timeout=timeout_ms
                         )
-                    _res_queue.put(
+                    await _put_with_snapshot(
+                        page,
                         {
                             "status": "success",
                             "message": f"Clicked element with ref_id={ref_id}",
@@ -513,7 +687,8 @@ async def _async_worker() -> None:  # noqa: C901
                         {"ref_id": ref_id, "url": current_url},
                     )
                     tb = traceback.format_exc()
-                    _res_queue.put(
+                    await _put_with_snapshot(
+                        page,
                         {"status": "error", "message": error_msg, "traceback": tb}
                     )
 
@@ -525,7 +700,8 @@ async def _async_worker() -> None:  # noqa: C901
                     f"Worker thread: Text input (ref_id={ref_id}, text='{text}')"
                 )
                 if ref_id is None:
-                    _res_queue.put(
+                    await _put_with_snapshot(
+                        page,
                         {
                             "status": "error",
                             "message": "ref_id is required to identify the element",
@@ -533,7 +709,8 @@ async def _async_worker() -> None:  # noqa: C901
                     )
                     continue
                 if text is None:
-                    _res_queue.put(
+                    await _put_with_snapshot(
+                        page,
                         {
                             "status": "error",
                             "message": "Text to input is not specified",
@@ -562,16 +739,12 @@ async def _async_worker() -> None:  # noqa: C901
                         log_operation_error(
                             "input_text", error_msg, {"ref_id": ref_id, "text": text}
                         )
-                        snapshot_list = await snapshot_mod.take_aria_snapshot(page)
-                        _res_queue.put(
-                            {
-                                "status": "error",
-                                "message": error_msg,
-                                "aria_snapshot": snapshot_list,
-                            }
+                        await _put_with_snapshot(
+                            page, {"status": "error", "message": error_msg}
                         )
                         continue
-                    _res_queue.put(
+                    await _put_with_snapshot(
+                        page,
                         {
                             "status": "success",
                             "message": f"Input text '{text}' to element with ref_id={ref_id}",
@@ -586,7 +759,9 @@ async def _async_worker() -> None:  # noqa: C901
                         error_msg,
                         {"ref_id": ref_id, "text": text, "url": current_url},
                     )
-                    _res_queue.put({"status": "error", "message": error_msg})
+                    await _put_with_snapshot(
+                        page, {"status": "error", "message": error_msg}
+                    )
 
             # Save cookies -------------------------------------------------------
             elif command == "save_cookies":
@@ -595,17 +770,17 @@ async def _async_worker() -> None:  # noqa: C901
                     cookies = await context.cookies()
                     with open(constants.COOKIE_FILE, "w", encoding="utf-8") as f:
                         json.dump(cookies, f, ensure_ascii=False, indent=2)
-                    _res_queue.put(
+                    _put_response(
                         {"status": "success", "message": "Cookies saved successfully"}
                     )
                 except Exception as e:
-                    _res_queue.put(
+                    _put_response(
                         {"status": "error", "message": f"Failed to save cookies: {e}"}
                     )
 
             # Current URL ----------------------------------------------------------
             elif command == "get_current_url":
-                _res_queue.put({"status": "success", "url": page.url})
+                _put_response({"status": "success", "url": page.url})
 
             # URL navigation ---------------------------------------------------------
             elif command == "goto":
@@ -616,11 +791,35 @@ async def _async_worker() -> None:  # noqa: C901
                         wait_until="load",
                         timeout=constants.DEFAULT_TIMEOUT_MS,
                     )
-                    _res_queue.put(
+                    _put_response(
                         {"status": "success", "message": f"Navigated to {target_url}"}
                     )
                 except Exception as e:
-                    _res_queue.put({"status": "error", "message": f"URL navigation failed: {e}"})
+                    _put_response({"status": "error", "message": f"URL navigation failed: {e}"})
+
+            # Wait for navigation --------------------------------------------------
+            elif command == "wait_for_navigation":
+                from_url = params.get("from_url")
+                timeout_ms = params.get("timeout_ms") or constants.DEFAULT_TIMEOUT_MS
+                try:
+                    await page.wait_for_url(
+                        lambda u: u != from_url, wait_until="load", timeout=timeout_ms
+                    )
+                    _put_response(
+                        {
+                            "status": "success",
+                            "message": "Navigation finished",
+                            "url": page.url,
+                        }
+                    )
+                except Exception as e:
+                    _put_response(
+                        {
+                            "status": "error",
+                            "message": f"No navigation from {from_url}: {e}",
+                            "url": page.url,
+                        }
+                    )
 
             # Screenshot -------------------------------------------------------------
             elif command == "take_screenshot":
@@ -640,14 +839,14 @@ async def _async_worker() -> None:  # noqa: C901
                     # Take screenshot
                     await page.screenshot(path=filepath, full_page=full_page)
                     
-                    _res_queue.put({
+                    _put_response({
                         "status": "success",
                         "message": f"Screenshot saved successfully",
                         "filepath": os.path.abspath(filepath),
                         "size": os.path.getsize(filepath) if os.path.exists(filepath) else 0
                     })
                 except Exception as e:
-                    _res_queue.put({
+                    _put_response({
                         "status": "error",
                         "message": f"Screenshot failed: {str(e)}"
                     })
@@ -655,21 +854,22 @@ async def _async_worker() -> None:  # noqa: C901
             # Unknown command ------------------------------------------------------
             else:
                 add_debug_log(f"Worker thread: Unknown command: {command}")
-                _res_queue.put(
+                _put_response(
                     {"status": "error", "message": f"Unknown command: {command}"}
                 )
 
-        except queue.Empty:
-            await asyncio.sleep(0.1)
         except Exception as e:
             add_debug_log(f"Worker thread: Unexpected error: {e}")
             try:
-                _res_queue.put({"status": "error", "message": f"Unexpected error: {e}"})
+                _put_response({"status": "error", "message": f"Unexpected error: {e}"})
             except queue.Full:
                 pass
 
     # finally block ---------------------------------------------------------
     add_debug_log("Worker thread: Cleanup process")
+    # Stop accepting commands (unless a newer worker has already taken over)
+    if _worker_loop is asyncio.get_running_loop():
+        _worker_loop = None
     try:
         if "browser" in locals():
             await browser.close()  # type: ignore[attr-defined]
@@ -12,12 +12,14 @@ from __future__ import annotations
 
 from .actions import click_element  # re-export
 from .actions import (cleanup_browser, get_aria_snapshot, get_current_url,
-                      goto_url, initialize_browser, input_text, save_cookies)
+                      goto_url, initialize_browser, input_text, save_cookies,
+                      wait_for_navigation)
 
 __all__: list[str] = [
     "initialize_browser",
     "get_aria_snapshot",
     "goto_url",
+    "wait_for_navigation",
     "click_element",
     "input_text",
     "get_current_url",
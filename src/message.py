@@ -204,6 +204,7 @@ def run_cli_mode() -> int:  # noqa: D401
 
     # Get tool configuration
     tool_config = {"tools": get_browser_tools_config(), "toolChoice": {"auto": {}}}
+    performance_config = {"latency": constants.PERFORMANCE_LATENCY}
 
     # Get current ARIA Snapshot for initial request
     aria_snapshot_result = get_aria_snapshot()
@@ -239,6 +240,7 @@ def run_cli_mode() -> int:  # noqa: D401
                 get_system_prompt(),
                 model_id,
                 tool_config,
+                performance_config,
             )
 
             # Update token usage
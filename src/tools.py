@@ -4,6 +4,7 @@ Tool definitions and dispatch module for Bedrock API
 Provides tool definitions for LLM and dispatch logic to forward tool calls to browser operation functions.
 """
 
+import functools
 import logging
 from typing import Any
 
@@ -14,8 +15,13 @@ from .utils import add_debug_log, log_operation_error
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
 def get_browser_tools_config() -> list[dict[str, Any]]:
-    """Get available browser operation tools configuration"""
+    """Get available browser operation tools configuration
+
+    The list is built once and shared between callers, so it must not be
+    modified.
+    """
     return [
         {
             "toolSpec": {
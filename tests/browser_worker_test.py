@@ -0,0 +1,306 @@
+"""Browser worker tests
+
+Checks the request/response protocol between callers and the browser worker
+thread, and how the worker behaves around process exit. The protocol tests
+use a stub worker, the worker tests run the real worker against a stub
+Playwright, and the tests that launch Chromium are marked ``e2e`` and only
+run with ``--e2e``.
+"""
+import queue
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# Offline start page, so the test does not depend on the network
+BLANK_PAGE_URL = (Path(__file__).parent / "fixtures" / "blank.html").resolve().as_uri()
+# Generous bound: browser start-up plus interpreter shutdown
+EXIT_TIMEOUT_SEC = 90
+
+
+@pytest.fixture
+def stub_worker(monkeypatch):
+    """Replace the browser worker with a stub that records submitted commands
+
+    Returns ``(actions, pending)``: the actions module and the list of commands
+    the stub has received. Tests answer them with ``_answer``.
+    """
+    # Imported here so that collection does not load the browser package
+    from src.browser import actions
+
+    ready = threading.Event()
+    ready.set()
+    monkeypatch.setattr(actions, "_worker_ready", ready)
+    monkeypatch.setattr(actions, "_thread_started", True)
+    monkeypatch.setattr(actions, "_res_queue", queue.Queue())
+    monkeypatch.setattr(actions, "_current_request_id", None)
+
+    pending: list[dict] = []
+
+    def submit(cmd):
+        pending.append(cmd)
+        return True
+
+    monkeypatch.setattr(actions, "_submit_command", submit)
+    return actions, pending
+
+
+class _StubPlaywright:
+    """Just enough of playwright.async_api for the browser worker
+
+    ``snapshot`` is what the page's snapshot script returns. ``launch_error``
+    makes ``chromium.launch`` fail; ``launch_delay`` / ``close_delay`` slow
+    down ``chromium.launch`` / ``browser.close`` (seconds).
+    """
+
+    def __init__(self, actions):
+        self.actions = actions
+        self.snapshot: list[dict] = []
+        self.launch_error: Exception | None = None
+        self.launch_delay = 0.0
+        self.close_delay = 0.0
+        self.page = None
+
+    def async_playwright(self):
+        stub = self
+
+        async def stop():
+            pass
+
+        async def launch(**_kwargs):
+            import asyncio
+
+            await asyncio.sleep(stub.launch_delay)
+            if stub.launch_error is not None:
+                raise stub.launch_error
+            return stub._browser()
+
+        async def start():
+            chromium = types.SimpleNamespace(launch=launch)
+            return types.SimpleNamespace(chromium=chromium, stop=stop)
+
+        return types.SimpleNamespace(start=start)
+
+    def _browser(self):
+        stub = self
+
+        async def noop(*_args, **_kwargs):
+            return None
+
+        async def evaluate(script, *_args):
+            if script == stub.actions.snapshot_mod._JS_GET_SNAPSHOT:
+                return {"snapshot": list(stub.snapshot), "errorCount": 0}
+            return None
+
+        async def wait_for_url(predicate, **_kwargs):
+            # Navigations are simulated by setting stub.page.url
+            if not predicate(page.url):
+                raise stub.actions.PlaywrightTimeoutError("Timeout waiting for URL")
+
+        locator = types.SimpleNamespace(click=noop, fill=noop, press=noop)
+        page = stub.page = types.SimpleNamespace(
+            url="about:blank",
+            goto=noop,
+            evaluate=evaluate,
+            wait_for_load_state=noop,
+            wait_for_url=wait_for_url,
+            locator=lambda _selector: locator,
+        )
+
+        async def new_page():
+            return page
+
+        async def new_context(**_kwargs):
+            return types.SimpleNamespace(
+                add_cookies=noop, new_page=new_page, cookies=noop
+            )
+
+        async def close():
+            import asyncio
+
+            await asyncio.sleep(stub.close_delay)
+
+        return types.SimpleNamespace(new_context=new_context, close=close)
+
+
+@pytest.fixture
+def stub_playwright(monkeypatch):
+    """Run the real browser worker against ``_StubPlaywright``
+
+    The worker is stopped after the test.
+    """
+    from src.browser import actions
+
+    stub = _StubPlaywright(actions)
+    module = types.ModuleType("playwright.async_api")
+    module.async_playwright = stub.async_playwright
+    module.TimeoutError = actions.PlaywrightTimeoutError
+    monkeypatch.setitem(sys.modules, "playwright.async_api", module)
+
+    async def visible(_page, _locator):
+        return None
+
+    monkeypatch.setattr(actions, "get_screen_size", lambda: (1920, 1080))
+    monkeypatch.setattr(actions, "ensure_element_visible", visible)
+    monkeypatch.setattr(actions, "_thread_started", False)
+    monkeypatch.setattr(actions, "_res_queue", queue.Queue())
+
+    yield stub
+
+    actions.cleanup_browser()
+    if actions._browser_thread is not None:
+        actions._browser_thread.join(timeout=5)
+
+
+def _answer(actions, cmd):
+    """Respond to ``cmd`` the way the worker does (tagged by _put_response)"""
+    actions._current_request_id = cmd["request_id"]
+    actions._put_response({"status": "success", "command": cmd["command"]})
+
+
+def test_late_response_is_dropped(stub_worker):
+    """A response that arrives after its caller timed out is not handed to the next caller"""
+    actions, pending = stub_worker
+
+    with pytest.raises(queue.Empty):
+        actions._send_command({"command": "first"}, timeout=0.05)
+
+    # The worker finally answers the first command, then the second one
+    def answer_both(cmd):
+        pending.append(cmd)
+        for queued in pending:
+            _answer(actions, queued)
+        return True
+
+    actions._submit_command = answer_both
+    res = actions._send_command({"command": "second"}, timeout=1)
+
+    assert res == {"status": "success", "command": "second"}
+    assert actions._res_queue.empty()
+
+
+def test_out_of_order_responses(stub_worker):
+    """The caller waits past responses to other requests until its own arrives"""
+    actions, pending = stub_worker
+
+    def answer_later(cmd):
+        pending.append(cmd)
+        # Deliver this command's response only after a stale one for an
+        # earlier request id, from a separate thread like the real worker
+        stale = {"request_id": cmd["request_id"] - 1, "command": "stale"}
+        threading.Timer(0.05, _answer, (actions, stale)).start()
+        threading.Timer(0.1, _answer, (actions, cmd)).start()
+        return True
+
+    actions._submit_command = answer_later
+    res = actions._send_command({"command": "mine"}, timeout=1)
+
+    assert res == {"status": "success", "command": "mine"}
+    assert actions._res_queue.empty()
+
+
+def test_click_and_input_snapshots_are_filtered(stub_playwright):
+    """Snapshots attached to click/input results only contain ALLOWED_ROLES"""
+    actions = stub_playwright.actions
+    button = {"role": "button", "name": "Search", "ref_id": 2}
+    stub_playwright.snapshot = [
+        {"role": "checkbox", "name": "Agree", "ref_id": 1},
+        button,
+    ]
+
+    assert actions.initialize_browser()["status"] == "success"
+    assert actions.get_aria_snapshot()["aria_snapshot"] == [button]
+    assert actions.click_element(2)["aria_snapshot"] == [button]
+    assert actions.input_text("speaker", 2)["aria_snapshot"] == [button]
+
+
+def test_wait_for_navigation(stub_playwright):
+    """wait_for_navigation succeeds only once the page has left the given URL"""
+    actions = stub_playwright.actions
+    assert actions.initialize_browser()["status"] == "success"
+
+    assert actions.wait_for_navigation("about:blank")["status"] == "error"
+
+    stub_playwright.page.url = "https://example.com/results"
+    res = actions.wait_for_navigation("about:blank")
+    assert res["status"] == "success"
+    assert res["url"] == "https://example.com/results"
+
+
+def test_restart_after_cleanup(stub_playwright):
+    """A worker still closing its browser must not mark the next one as ready"""
+    actions = stub_playwright.actions
+    stub_playwright.snapshot = [{"role": "button", "name": "Search", "ref_id": 2}]
+    # The old worker finishes closing while the new one is still launching
+    stub_playwright.close_delay = 0.1
+    stub_playwright.launch_delay = 0.5
+
+    assert actions.initialize_browser()["status"] == "success"
+    first_thread = actions._browser_thread
+    assert actions.cleanup_browser()["status"] == "success"
+
+    assert actions.initialize_browser()["status"] == "success"
+    assert actions.get_aria_snapshot()["status"] == "success"
+
+    first_thread.join(timeout=5)
+    assert not first_thread.is_alive()
+    assert actions._browser_thread is not first_thread
+    assert actions._browser_thread.is_alive()
+
+
+@pytest.mark.parametrize("failure", ["import", "launch"])
+def test_startup_failure_is_reported(stub_playwright, monkeypatch, failure):
+    """Commands after a failed start report the error instead of timing out"""
+    actions = stub_playwright.actions
+    if failure == "import":
+        monkeypatch.setitem(sys.modules, "playwright.async_api", None)
+    else:
+        stub_playwright.launch_error = RuntimeError("Chromium not installed")
+
+    init_res = actions.initialize_browser()
+    assert init_res["status"] == "error"
+    assert not actions._thread_started
+
+    start = time.monotonic()
+    res = actions.get_aria_snapshot()
+    assert time.monotonic() - start < 5
+    assert res["status"] == "error"
+    assert init_res["message"] in res["message"]
+
+
+@pytest.mark.e2e
+def test_process_exits_without_cleanup(tmp_path):
+    """run_cli_mode returning early (no cleanup_browser) must not hang the interpreter"""
+    script = textwrap.dedent(
+        f"""
+        import sys
+
+        import main
+
+        main.DEFAULT_CREDENTIALS_PATH = {str(tmp_path / "missing.json")!r}
+        main.DEFAULT_INITIAL_URL = {BLANK_PAGE_URL!r}
+
+        from src.message import run_cli_mode
+
+        sys.exit(run_cli_mode())
+        """
+    )
+    try:
+        proc = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            text=True,
+            timeout=EXIT_TIMEOUT_SEC,
+        )
+    except subprocess.TimeoutExpired as e:
+        pytest.fail(f"Interpreter did not exit after run_cli_mode returned: {e}")
+
+    # Missing credentials: run_cli_mode returns 1 after starting the browser
+    assert proc.returncode == 1, proc.stderr
@@ -8,52 +8,45 @@ Includes tests for both normal case and error case (e.g., clicking non-existent
 
 Environment variables:
     HEADLESS - If 'true', runs the browser in headless mode
+    DEBUG_TESTS - If '1', enables DEBUG logging
+
+Run with ``pytest tests/click_element_test.py`` or directly, in which case
+``main()`` delegates to pytest (over xdist workers when it is installed).
 """
+import importlib.util
 import logging
 import os
 import sys
-import time
-import traceback
 
-# Add project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
+
+# Add project root to Python path when run as a script (under pytest,
+# conftest.py has already done it once for the whole session)
+if not __package__:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from src.browser import (cleanup_browser, click_element, get_aria_snapshot,
-                         goto_url, initialize_browser)
+# src.browser is imported inside the tests so that collection does not load it
 from src.utils import setup_logging
 
 
 # Test parameters (modify these to change test conditions)
+# Opened by the ready_browser fixture in conftest.py before each test
 TEST_URL = "https://www.google.co.jp/"
 TEST_REF_ID = 26
 # For error case testing
 TEST_ERROR_REF_ID = 9999
 
 
-def test_normal_case(url=TEST_URL, ref_id=TEST_REF_ID):
+@pytest.mark.e2e
+def test_normal_case(aria_snapshot, url=TEST_URL, ref_id=TEST_REF_ID):
     """Normal case test - Click the specified element"""
-    logging.info("=== Normal case test start: url=%s, ref_id=%s ===", url, ref_id)
-
-    init_res = initialize_browser()
-    if init_res.get("status") != "success":
-        logging.error("Browser initialization failed: %s", init_res.get("message"))
-        assert False, "Browser initialization failed"
+    from src.browser import (click_element, get_aria_snapshot, get_current_url,
+                             goto_url, wait_for_navigation)
 
-    goto_res = goto_url(url)
-    if goto_res.get("status") != "success":
-        logging.error("URL navigation failed: %s", goto_res.get("message"))
-        assert False, "URL navigation failed"
-    logging.info("Page loading complete")
-
-    # Get ARIA Snapshot before clicking
-    aria_before_res = get_aria_snapshot()
-    if aria_before_res.get("status") != "success":
-        logging.error(
-            "Failed to get ARIA Snapshot before click: %s", aria_before_res.get("message")
-        )
-        assert False, "ARIA Snapshot retrieval failed"
+    logging.info("=== Normal case test start: url=%s, ref_id=%s ===", url, ref_id)
 
-    elements_before = aria_before_res.get("aria_snapshot", [])
+    # The shared browser has already opened TEST_URL (see conftest.py)
+    elements_before = aria_snapshot
     logging.info("Number of elements before click: %s", len(elements_before))
 
     element_exists = any(e.get("ref_id") == ref_id for e in elements_before)
@@ -102,6 +95,7 @@ def test_normal_case(url=TEST_URL, ref_id=TEST_REF_ID):
         )
 
     # Execute click
+    url_before = get_current_url()
     logging.info("Starting click operation: ref_id=%s", ref_id)
     click_res = click_element(ref_id)
     if click_res.get("status") != "success":
@@ -110,8 +104,12 @@ def test_normal_case(url=TEST_URL, ref_id=TEST_REF_ID):
 
     logging.info("Click operation successful")
 
-    # Verification after operation: Wait for page changes
-    time.sleep(1)
+    # Verification after operation: a link click starts a navigation, so wait
+    # for the new page to load (other elements do not navigate)
+    if target_element and target_element.get("role") == "link":
+        nav_res = wait_for_navigation(url_before)
+        if nav_res.get("status") != "success":
+            logging.warning("Link did not navigate: %s", nav_res.get("message"))
 
     # Get ARIA Snapshot after click and verify
     aria_after_res = get_aria_snapshot()
@@ -159,30 +157,15 @@ def test_normal_case(url=TEST_URL, ref_id=TEST_REF_ID):
     assert True
 
 
-def test_error_case(url=TEST_URL, ref_id=TEST_ERROR_REF_ID):
+@pytest.mark.e2e
+def test_error_case(aria_snapshot, url=TEST_URL, ref_id=TEST_ERROR_REF_ID):
     """Error case test - Click a non-existent element"""
-    logging.info("=== Error case test start: url=%s, non-existent ref_id=%s ===", url, ref_id)
-
-    init_res = initialize_browser()
-    if init_res.get("status") != "success":
-        logging.error("Browser initialization failed: %s", init_res.get("message"))
-        assert False, "Browser initialization failed"
-
-    goto_res = goto_url(url)
-    if goto_res.get("status") != "success":
-        logging.error("URL navigation failed: %s", goto_res.get("message"))
-        assert False, "URL navigation failed"
-    logging.info("Page loading complete")
+    from src.browser import click_element, get_aria_snapshot
 
-    # Get ARIA Snapshot before clicking
-    aria_before_res = get_aria_snapshot()
-    if aria_before_res.get("status") != "success":
-        logging.error(
-            "Failed to get ARIA Snapshot before click: %s", aria_before_res.get("message")
-        )
-        assert False, "ARIA Snapshot retrieval failed"
+    logging.info("=== Error case test start: url=%s, non-existent ref_id=%s ===", url, ref_id)
 
-    elements_before = aria_before_res.get("aria_snapshot", [])
+    # The shared browser has already opened TEST_URL (see conftest.py)
+    elements_before = aria_snapshot
 
     logging.info("Starting click operation on non-existent element: ref_id=%s", ref_id)
     click_res = click_element(ref_id)
@@ -214,57 +197,36 @@ def test_error_case(url=TEST_URL, ref_id=TEST_ERROR_REF_ID):
 
 
 def main():
-    """Main function - Controls test execution and processes results"""
-    # Apply test settings
-    url = TEST_URL
-    ref_id = TEST_REF_ID
-
+    """Main function - Runs the test cases in this file through pytest"""
     setup_logging()
-    # Always set log level to DEBUG
-    logging.getLogger().setLevel(logging.DEBUG)
+    # Every test here drives the real browser
+    pytest_args = [__file__, "-q", "--e2e"]
+    # DEBUG logging is opt-in (DEBUG_TESTS=1)
+    if os.environ.get("DEBUG_TESTS") == "1":
+        logging.getLogger().setLevel(logging.DEBUG)
+        pytest_args.append("--log-level=DEBUG")
+    if importlib.util.find_spec("xdist") is not None:
+        # Each worker process owns its own browser (see conftest.py)
+        pytest_args += ["-n", "auto", "--dist=load"]
 
     # Output test parameters
     logging.info(
         "Test parameters: url=%s, ref_id=%s, headless=%s",
-        url,
-        ref_id,
+        TEST_URL,
+        TEST_REF_ID,
         os.environ.get("HEADLESS", "false"),
     )
 
     try:
-        # Test functions don't return values, so catch exceptions to determine success/failure
-        normal_success = False
-        error_success = False
-
-        try:
-            test_normal_case(url, ref_id)
-            normal_success = True
-        except AssertionError as e:
-            logging.error("Normal case test failed: %s", e)
-
-        try:
-            test_error_case(url, TEST_ERROR_REF_ID)
-            error_success = True
-        except AssertionError as e:
-            logging.error("Error case test failed: %s", e)
-
-        if normal_success and error_success:
+        exit_code = int(pytest.main(pytest_args))
+        if exit_code == 0:
             logging.info("All tests passed successfully")
-            return 0
         else:
             logging.error("Some tests failed")
-            return 1
+        return exit_code
     except Exception as e:
-        logging.error("Error during test execution: %s", e)
-        traceback.print_exc()
+        logging.exception("Error during test execution: %s", e)
         return 1
-    finally:
-        # Always clean up the browser
-        try:
-            cleanup_browser()
-            logging.info("Browser cleanup completed")
-        except Exception as e:
-            logging.error("Error during browser cleanup: %s", e)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,147 @@
+"""Shared pytest configuration for the browser automation tests
+
+Launching Chromium and loading the first page dominate the run time of the
+E2E tests, so the browser is started once per session by ``browser`` and
+torn down after the last test. ``ready_browser`` only navigates the shared
+browser back to the test page, so every test starts from the same state.
+
+Under pytest-xdist every worker process runs its own browser worker thread
+(and therefore its own Chromium instance). The fixtures below keep the
+on-disk state those browsers touch separate per worker so that parallel
+runs do not overwrite each other.
+
+Tests that launch the browser are skipped unless ``--e2e`` is given, so a
+plain ``pytest`` run stays fast on a development machine.
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Iterator
+
+import pytest
+
+# Make the project root importable once for every test module
+_ROOT = str(Path(__file__).resolve().parent.parent)
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
+
+import main as constants  # noqa: E402
+
+try:
+    from xdist import get_xdist_worker_id
+except ImportError:  # pragma: no cover
+
+    def get_xdist_worker_id(request_or_session) -> str:  # noqa: ARG001
+        """Fallback for when pytest-xdist is not installed"""
+        return "master"
+
+
+# Page the shared browser is opened on. A local file keeps the tests offline
+# and avoids the DNS/TLS/page-load cost of a live site; set E2E_TEST_URL to
+# run against a real page instead (e.g. in a nightly job).
+TEST_URL = os.environ.get("E2E_TEST_URL") or (
+    (Path(__file__).parent / "fixtures" / "blank.html").resolve().as_uri()
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--e2e",
+        action="store_true",
+        default=False,
+        help="run the tests that launch a real browser",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "e2e: launches a real browser (skipped unless --e2e is given)"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip browser tests unless --e2e is given, as Chromium dominates the run time"""
+    if config.getoption("--e2e"):
+        return
+    skip_e2e = pytest.mark.skip(reason="needs --e2e")
+    for item in items:
+        if "e2e" in item.keywords or "browser" in getattr(item, "fixturenames", ()):
+            item.add_marker(skip_e2e)
+
+
+@pytest.fixture(scope="session")
+def worker_id(request) -> str:
+    """Return the xdist worker id ("gw0", "gw1", ...) or "master" when not distributed"""
+    return get_xdist_worker_id(request)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _worker_cookie_file(worker_id, tmp_path_factory):
+    """Give each xdist worker its own copy of the cookie file"""
+    if worker_id == "master":
+        yield constants.COOKIE_FILE
+        return
+
+    shared_cookie_file = constants.COOKIE_FILE
+    worker_cookie_file = tmp_path_factory.mktemp(f"browser-{worker_id}") / (
+        os.path.basename(shared_cookie_file)
+    )
+    if os.path.exists(shared_cookie_file):
+        shutil.copyfile(shared_cookie_file, worker_cookie_file)
+
+    constants.COOKIE_FILE = str(worker_cookie_file)
+    yield constants.COOKIE_FILE
+    constants.COOKIE_FILE = shared_cookie_file
+
+
+@pytest.fixture(scope="session")
+def browser(request) -> Iterator[dict[str, Any]]:
+    """Start the browser worker once per session and close it after the last test"""
+    # Imported here so that collecting tests which never use the browser
+    # does not load the browser package
+    from src.browser import cleanup_browser, initialize_browser
+
+    # Also covers tests that request the browser at run time
+    # (request.getfixturevalue) and so escaped the collection-time skip
+    if not request.config.getoption("--e2e"):
+        pytest.skip("needs --e2e")
+
+    init_res = initialize_browser()
+    assert init_res.get("status") == "success", (
+        f"Browser initialization failed: {init_res.get('message')}"
+    )
+
+    yield init_res
+
+    cleanup_browser()
+
+
+@pytest.fixture
+def ready_browser(browser, request) -> dict[str, Any]:
+    """Reset the shared browser to the test page before each test
+
+    The page is the module's ``TEST_URL`` if it defines one, else the default
+    ``TEST_URL`` above.
+    """
+    from src.browser import goto_url
+
+    url = getattr(request.module, "TEST_URL", TEST_URL)
+    goto_res = goto_url(url)
+    assert goto_res.get("status") == "success", (
+        f"URL navigation failed: {goto_res.get('message')}"
+    )
+    return browser
+
+
+@pytest.fixture
+def aria_snapshot(ready_browser) -> list[dict[str, Any]]:
+    """ARIA Snapshot of the page opened by ``ready_browser``"""
+    from src.browser import get_aria_snapshot
+
+    aria_res = get_aria_snapshot()
+    assert aria_res.get("status") == "success", (
+        f"ARIA Snapshot retrieval failed: {aria_res.get('message')}"
+    )
+    return aria_res.get("aria_snapshot", [])
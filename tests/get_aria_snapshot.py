@@ -6,15 +6,17 @@ and retrieves the latest ARIA Snapshot, which is output to the console.
 
 Environment variables:
     HEADLESS - If 'true', runs the browser in headless mode
+    DEBUG_TESTS - If '1', enables DEBUG logging
 """
 import json
 import logging
 import os
 import sys
-import traceback
 
-# Add project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+# Add project root to Python path when run as a script (under pytest,
+# conftest.py has already done it once for the whole session)
+if not __package__:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from src.browser import (cleanup_browser, get_aria_snapshot, goto_url,
                          initialize_browser)
@@ -33,8 +35,9 @@ def main():
     url = TEST_URL
 
     setup_logging()
-    # Always set log level to DEBUG
-    logging.getLogger().setLevel(logging.DEBUG)
+    # DEBUG logging is opt-in (DEBUG_TESTS=1)
+    if os.environ.get("DEBUG_TESTS") == "1":
+        logging.getLogger().setLevel(logging.DEBUG)
 
     # Output test parameters
     logging.info(
@@ -122,8 +125,7 @@ def main():
         return 0
     except (RuntimeError, IOError) as e:
         # Specify more concrete exception types
-        logging.error("Error during test execution: %s", e)
-        traceback.print_exc()
+        logging.exception("Error during test execution: %s", e)
         return 1
     finally:
         # Always clean up the browser
@@ -5,24 +5,32 @@ and presses Enter. Includes both normal and error cases (e.g., non-existent elem
 
 Environment variables:
     HEADLESS - If 'true', runs the browser in headless mode
+    DEBUG_TESTS - If '1', enables DEBUG logging
+
+Run with ``pytest tests/input_text_test.py`` or directly, in which case
+``main()`` delegates to pytest (over xdist workers when it is installed).
 """
 
+import importlib.util
 import logging
 import os
 import signal
 import sys
 import time
-import traceback
 
-# Add project root to Python path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
+
+# Add project root to Python path when run as a script (under pytest,
+# conftest.py has already done it once for the whole session)
+if not __package__:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from src.browser import (cleanup_browser, get_aria_snapshot, goto_url,
-                         initialize_browser, input_text)
+# src.browser is imported inside the tests so that collection does not load it
 from src.utils import setup_logging
 
 
 # Test parameters (modify these to change test conditions)
+# Opened by the ready_browser fixture in conftest.py before each test
 TEST_URL = "https://www.google.co.jp/"
 TEST_REF_ID = 13
 TEST_TEXT = "Amazon"
@@ -42,52 +50,27 @@ if sys.platform == "win32":
     logging.warning("On Windows, test timeout handling is limited.")
 
 
+@pytest.mark.e2e
 def test_normal_case(
+    aria_snapshot,
     url=TEST_URL, ref_id=TEST_REF_ID, text=TEST_TEXT, operation_timeout=TEST_TIMEOUT
 ):
     """Normal case test - Input text to the specified element"""
+    from src.browser import (get_aria_snapshot, get_current_url, goto_url,
+                             input_text, wait_for_navigation)
+
     logging.info(
         "=== Normal case test start: url=%s, ref_id=%s, text='%s' ===", url, ref_id, text
     )
 
     start_time = time.time()
 
-    init_res = initialize_browser()
-    if init_res.get("status") != "success":
-        logging.error("Browser initialization failed: %s", init_res.get("message"))
-        assert False, "Browser initialization failed"
-
-    if time.time() - start_time > operation_timeout:
-        logging.error("Browser initialization timed out (%s seconds)", operation_timeout)
-        assert False, "Browser initialization timed out"
-
-    # Record initial URL
-    initial_url = ""
-    goto_res = goto_url(url)
-    if goto_res.get("status") != "success":
-        logging.error("URL navigation failed: %s", goto_res.get("message"))
-        assert False, "URL navigation failed"
-    else:
-        initial_url = goto_res.get("current_url", url)
+    # The shared browser has already opened TEST_URL and taken the initial
+    # ARIA Snapshot that injects the ref-id attributes (see conftest.py)
+    initial_url = url
     logging.info("Page loading complete: %s", initial_url)
 
-    if time.time() - start_time > operation_timeout:
-        logging.error("URL navigation timed out (%s seconds)", operation_timeout)
-        assert False, "URL navigation timed out"
-
-    # Initial ARIA Snapshot to inject ref-id attributes into DOM
-    aria_res = get_aria_snapshot()
-    if aria_res.get("status") != "success":
-        logging.error("ARIA Snapshot retrieval failed: %s", aria_res.get("message"))
-        assert False, "ARIA Snapshot retrieval failed"
-
-    if time.time() - start_time > operation_timeout:
-        logging.error(
-            "ARIA Snapshot retrieval timed out (%s seconds)", operation_timeout
-        )
-        assert False, "ARIA Snapshot retrieval timed out"
-
-    elements_before = aria_res.get("aria_snapshot", [])
+    elements_before = aria_snapshot
     logging.info("Number of elements retrieved: %d", len(elements_before))
 
     logging.info("Available elements:")
@@ -232,6 +215,7 @@ def test_normal_case(
         assert False, "Element search timed out"
 
     # Execute text input
+    url_before = get_current_url()
     logging.info("Executing text input: text='%s', ref_id=%s", text, actual_ref_id)
     input_res = input_text(text, actual_ref_id)
     if input_res.get("status") != "success":
@@ -245,8 +229,10 @@ def test_normal_case(
     logging.info("Text input processing successful")
 
     # Post-operation verification
-    # 1. Wait briefly for screen changes
-    time.sleep(2)
+    # 1. Wait for the page opened by Enter (e.g. search results) to load
+    nav_res = wait_for_navigation(url_before)
+    if nav_res.get("status") != "success":
+        logging.warning("Enter did not navigate: %s", nav_res.get("message"))
 
     # 2. Get current URL and check for changes
     current_url_res = goto_url("")
@@ -295,8 +281,13 @@ def test_normal_case(
     assert True
 
 
-def test_error_case(url=TEST_URL, ref_id=TEST_ERROR_REF_ID, text=TEST_TEXT):
+@pytest.mark.e2e
+def test_error_case(
+    aria_snapshot, url=TEST_URL, ref_id=TEST_ERROR_REF_ID, text=TEST_TEXT
+):
     """Error case test - Input text to a non-existent element"""
+    from src.browser import get_aria_snapshot, goto_url, input_text
+
     logging.info(
         "=== Error case test start: url=%s, non-existent ref_id=%s, text='%s' ===",
         url,
@@ -304,29 +295,12 @@ def test_error_case(url=TEST_URL, ref_id=TEST_ERROR_REF_ID, text=TEST_TEXT):
         text,
     )
 
-    init_res = initialize_browser()
-    if init_res.get("status") != "success":
-        logging.error("Browser initialization failed: %s", init_res.get("message"))
-        assert False, "Browser initialization failed"
-
-    # Record initial state
-    goto_res = goto_url(url)
-    if goto_res.get("status") != "success":
-        logging.error("URL navigation failed: %s", goto_res.get("message"))
-        assert False, "URL navigation failed"
-
-    initial_url = goto_res.get("current_url", url)
+    # The shared browser has already opened TEST_URL (see conftest.py)
+    initial_url = url
     logging.info("Page loading complete: %s", initial_url)
 
     # Record DOM state before operation
-    aria_before_res = get_aria_snapshot()
-    if aria_before_res.get("status") != "success":
-        logging.error(
-            "Failed to get ARIA Snapshot before operation: %s", aria_before_res.get("message")
-        )
-        assert False, "ARIA Snapshot retrieval failed"
-
-    elements_before = aria_before_res.get("aria_snapshot", [])
+    elements_before = aria_snapshot
     logging.info("Element count before operation: %d", len(elements_before))
 
     # Execute text input (to non-existent element)
@@ -373,23 +347,26 @@ def test_error_case(url=TEST_URL, ref_id=TEST_ERROR_REF_ID, text=TEST_TEXT):
 
 
 def main():
-    """Main function - Controls test execution"""
-    # Apply test settings
-    url = TEST_URL
-    ref_id = TEST_REF_ID
-    text = TEST_TEXT
+    """Main function - Runs the test cases in this file through pytest"""
     timeout = 60  # Overall test timeout (seconds)
 
     setup_logging()
-    # Always set log level to DEBUG
-    logging.getLogger().setLevel(logging.DEBUG)
+    # Every test here drives the real browser
+    pytest_args = [__file__, "-q", "--e2e"]
+    # DEBUG logging is opt-in (DEBUG_TESTS=1)
+    if os.environ.get("DEBUG_TESTS") == "1":
+        logging.getLogger().setLevel(logging.DEBUG)
+        pytest_args.append("--log-level=DEBUG")
+    if importlib.util.find_spec("xdist") is not None:
+        # Each worker process owns its own browser (see conftest.py)
+        pytest_args += ["-n", "auto", "--dist=load"]
 
     # Output test parameters
     logging.info(
         "Test parameters: url=%s, ref_id=%s, text='%s', headless=%s, timeout=%s seconds",
-        url,
-        ref_id,
-        text,
+        TEST_URL,
+        TEST_REF_ID,
+        TEST_TEXT,
         os.environ.get("HEADLESS", "false"),
         timeout,
     )
@@ -403,21 +380,7 @@ def main():
     try:
         logging.info("Test start time: %s", time.strftime("%Y-%m-%d %H:%M:%S"))
 
-        # Test functions don't return values, so catch exceptions to determine success/failure
-        normal_success = False
-        error_success = False
-
-        try:
-            test_normal_case(url, ref_id, text)
-            normal_success = True
-        except AssertionError as e:
-            logging.error("Normal case test failed: %s", e)
-
-        try:
-            test_error_case(url, TEST_ERROR_REF_ID, text)
-            error_success = True
-        except AssertionError as e:
-            logging.error("Error case test failed: %s", e)
+        exit_code = int(pytest.main(pytest_args))
 
         if sys.platform != "win32":
             signal.alarm(0)
@@ -425,25 +388,16 @@ def main():
         elapsed_time = time.time() - start_time
         logging.info("Test execution time: %.2f seconds", elapsed_time)
 
-        if normal_success and error_success:
+        if exit_code == 0:
             logging.info("All tests passed successfully")
-            return 0
         else:
             logging.error("Some tests failed")
-            return 1
+        return exit_code
     except (RuntimeError, IOError) as e:
         if sys.platform != "win32":
             signal.alarm(0)
-        logging.error("Error during test execution: %s", e)
-        traceback.print_exc()
+        logging.exception("Error during test execution: %s", e)
         return 1
-    finally:
-        # Always clean up the browser
-        try:
-            cleanup_browser()
-            logging.info("Browser cleanup completed")
-        except Exception as e:
-            logging.error("Error during browser cleanup: %s", e)
 
 
 if __name__ == "__main__":
@@ -7,33 +7,80 @@ with a stopReason of "endTurn" even when errors occur.
 Environment variables:
     HEADLESS - If 'true', runs the browser in headless mode
     CI - If 'true', uses CI environment log settings
+    DEBUG_TESTS - If '1', enables DEBUG logging (same as --debug)
+    E2E_TEST_URL - Page to open instead of the local tests/fixtures/blank.html
+    E2E_SNAPSHOT_DIAG - If '1', takes extra ARIA Snapshots to log DOM changes
+    RUN_INTEGRATION - If '1', runs against a real browser instead of a mocked
+        ARIA Snapshot (under plain pytest, also pass --e2e)
+
+The Bedrock calls pass ``performanceConfig={"latency": "optimized"}`` through
+``call_bedrock_api``. When pointing these tests at real Bedrock, use a model
+and region that support latency-optimized inference or drop the setting.
+
+Run with ``pytest tests/main_e2e_test.py`` or directly, in which case
+``main()`` delegates to pytest. With the mocked browser the cases finish in
+milliseconds, so they run in a single process; only RUN_INTEGRATION=1 runs
+(or ``--parallel``) distribute them over xdist workers when it is installed.
+
+Options:
+    --parallel - Run the test cases over xdist workers
+    --serial - Run the test cases in a single process even with RUN_INTEGRATION=1
+    --debug - Enable DEBUG logging (API timings)
+    Any other arguments are passed through to pytest (e.g. ``-k error``)
 """
 
+import argparse
+import copy
+import functools
+import importlib.util
+import itertools
 import logging
 import os
 import sys
 import time
-import traceback
-from typing import Any, Dict
-from unittest.mock import MagicMock, patch
+from typing import Any, Dict, Iterable, Iterator
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+import pytest
 
-from src.bedrock import (
-    analyze_stop_reason, call_bedrock_api)
-from src.browser import (
-    cleanup_browser, get_aria_snapshot, goto_url, initialize_browser)
+# Add project root to Python path when run as a script (under pytest,
+# conftest.py has already done it once for the whole session)
+if not __package__:
+    sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+# src.bedrock (boto3) and src.browser are imported inside the tests so that
+# collection and xdist worker start-up do not pay for them
+from src.exceptions import BedrockAPIError
 from src.utils import \
     setup_logging
 
 # Test parameters (modify these to change test conditions)
-TEST_URL = "https://www.google.co.jp/"
+# The page under test is mocked or, with RUN_INTEGRATION=1, opened by the
+# browser fixtures in conftest.py
 TEST_MODEL_ID = "test-model"
 TEST_SYSTEM_PROMPT = "Test system prompt"
 TEST_USER_QUERY = "Test query"
-TEST_MAX_TURNS = 3
-# Operation timeout (seconds)
-TEST_TIMEOUT = 60
+# Mirrors the performanceConfig that real (non-mocked) runs should request
+TEST_PERFORMANCE_CONFIG = {"latency": "optimized"}
+# The mocked model always answers with end_turn, so one turn is enough
+TEST_MAX_TURNS = 1
+# Snapshots beyond the fixture's only feed DOM-change log lines; opt in with
+# E2E_SNAPSHOT_DIAG=1
+_SNAPSHOT_DIAGNOSTICS = os.environ.get("E2E_SNAPSHOT_DIAG") == "1"
+# The Bedrock calls are mocked and never touch the page, so a real browser is
+# only started for integration runs
+_RUN_INTEGRATION = os.environ.get("RUN_INTEGRATION") == "1"
+MOCK_ARIA_SNAPSHOT = [
+    {"ref_id": 1, "role": "link", "name": "x"},
+    {"ref_id": 2, "role": "textbox", "name": "Search"},
+    {"ref_id": 3, "role": "button", "name": "Submit"},
+]
+
+# Request parameters shared by all tests. call_bedrock_api does not modify
+# them; test_main_e2e deep-copies _BASE_MESSAGES because it appends to it.
+_BASE_MESSAGES: list[dict[str, Any]] = [
+    {"role": "user", "content": [{"text": TEST_USER_QUERY}]}
+]
+_TOOL_CONFIG: dict[str, Any] = {"tools": [], "toolChoice": {"auto": {}}}
 
 MOCK_BEDROCK_RESPONSE = {
     "output": {
@@ -58,120 +105,229 @@ MOCK_ERROR_RESPONSE = {
 }
 
 
+class _StubBedrock:
+    """Minimal stand-in for the bedrock-runtime client
+
+    ``call_bedrock_api`` only calls ``converse``, so a plain class is enough
+    and avoids MagicMock's call recording and attribute auto-creation.
+    Responses are returned in order; exception instances are raised.
+    """
+
+    def __init__(self, responses: Iterable[Any]):
+        self._responses = iter(responses)
+        self.last_request: Dict[str, Any] = {}
+
+    def reset(self, responses: Iterable[Any]) -> "_StubBedrock":
+        """Replace the pending responses and forget the last request"""
+        self._responses = iter(responses)
+        self.last_request = {}
+        return self
+
+    def converse(self, **kwargs) -> Dict[str, Any]:
+        self.last_request = kwargs
+        response = next(self._responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+# Built once per module; the factories only re-arm the responses
+_SHARED_STUB = _StubBedrock(())
+_ERROR_STUB = _StubBedrock(())
+
+
 def mock_bedrock_client(*args, **kwargs):  
     """Create a mock Bedrock client"""
-    mock_client = MagicMock()
-    mock_client.converse.return_value = MOCK_BEDROCK_RESPONSE
-    return mock_client
+    return _SHARED_STUB.reset(itertools.repeat(MOCK_BEDROCK_RESPONSE))
+
+
+def mock_error_client(*args, **kwargs):  
+    """Create a mock Bedrock client whose first call fails"""
+    return _ERROR_STUB.reset([Exception("Test error"), MOCK_ERROR_RESPONSE])
+
+
+@functools.lru_cache(maxsize=16)
+def _stop_analysis(stop_reason: str) -> Dict[str, Any]:
+    """analyze_stop_reason, memoized per stopReason for the mocked responses
+
+    The production function is left uncached because it logs on every call.
+    Callers must not mutate the returned dictionary.
+    """
+    from src.bedrock import analyze_stop_reason
+
+    return analyze_stop_reason(stop_reason)
+
+
+# Fields checked by verify_api_response
+_REQUIRED_FIELDS = frozenset(("output", "stopReason", "usage"))
+_USAGE_FIELDS = frozenset(("inputTokens", "outputTokens", "totalTokens"))
 
 
 def verify_api_response(response: Dict[str, Any]) -> bool:
     """Generic function to verify API response
 
+    Returns on the first failed check, cheapest checks first.
+
     Args:
         response: Response from Bedrock API
 
     Returns:
         bool: Whether verification was successful
     """
-    success = True
-
     # 1. Basic structure check
     if not isinstance(response, dict):
         logging.error("API response must be a dict type")
         return False
 
-    # 2. Check for required fields
-    required_fields = ["output", "stopReason", "usage"]
-    for field in required_fields:
-        if field not in response:
-            logging.error("Required field '%s' is missing from response", field)
-            success = False
-
-    if not success:
+    # 2. Analyze stopReason
+    stop_reason = response.get("stopReason")
+    if stop_reason != "end_turn":
+        logging.error("stopReason is '%s' instead of expected 'end_turn'", stop_reason)
         return False
 
-    # 3. Check output message structure
-    output = response.get("output", {})
-    message = output.get("message", {})
+    # 3. Check for required fields
+    missing_fields = _REQUIRED_FIELDS - response.keys()
+    if missing_fields:
+        logging.error(
+            "Required fields %s are missing from response", sorted(missing_fields)
+        )
+        return False
 
+    # 4. Check output message structure
+    message = response["output"].get("message", {})
     if not message.get("role"):
         logging.error("Message is missing role field")
-        success = False
+        return False
 
     content = message.get("content", [])
     if not content or not isinstance(content, list):
         logging.error("Message content field is invalid")
-        success = False
+        return False
 
-    # 4. Check usage information
-    usage = response.get("usage", {})
-    usage_fields = ["inputTokens", "outputTokens", "totalTokens"]
-    for field in usage_fields:
-        if field not in usage:
+    # 5. Check usage information (warnings only, never fails)
+    if logging.getLogger().isEnabledFor(logging.WARNING):
+        usage = response["usage"]
+        for field in sorted(_USAGE_FIELDS - usage.keys()):
             logging.warning("Usage information missing '%s' field", field)
 
-    # 5. Analyze stopReason
-    stop_reason = response.get("stopReason")
-    if stop_reason != "end_turn":
-        logging.error("stopReason is '%s' instead of expected 'end_turn'", stop_reason)
-        success = False
+    return True
 
-    return success
 
+@pytest.fixture(scope="module", autouse=True)
+def _patch_bedrock() -> Iterator[None]:
+    """Patch create_bedrock_client with the stub once for the whole module"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("src.bedrock.create_bedrock_client", mock_bedrock_client)
+        yield
 
-def test_normal_case(url=TEST_URL):
-    """Normal case test - Standard conversation API flow"""
-    logging.info("=== Normal case test start ===")
 
-    # Browser initialization and preparation
-    init_res = initialize_browser()
-    if init_res.get("status") != "success":
-        logging.error("Browser initialization failed: %s", init_res.get("message"))
-        assert False, "Browser initialization failed"
+@pytest.fixture
+def page_snapshot(request, monkeypatch) -> list[dict[str, Any]]:
+    """Initial ARIA Snapshot of the page under test
 
-    goto_res = goto_url(url)
-    if goto_res.get("status") != "success":
-        logging.error("URL navigation failed: %s", goto_res.get("message"))
-        assert False, "URL navigation failed"
+    Mocked (together with ``src.browser.get_aria_snapshot``) unless
+    RUN_INTEGRATION=1, in which case the real browser fixtures from
+    conftest.py are used.
+    """
+    if _RUN_INTEGRATION:
+        return request.getfixturevalue("aria_snapshot")
 
-    # Initial ARIA snapshot retrieval
-    aria_res = get_aria_snapshot()
-    if aria_res.get("status") != "success":
-        logging.error("ARIA Snapshot retrieval failed: %s", aria_res.get("message"))
-        assert False, "ARIA Snapshot retrieval failed"
+    monkeypatch.setattr(
+        "src.browser.get_aria_snapshot",
+        lambda: {"status": "success", "aria_snapshot": list(MOCK_ARIA_SNAPSHOT)},
+    )
+    return list(MOCK_ARIA_SNAPSHOT)
+
+
+@pytest.mark.parametrize(
+    "client_factory, first_call_fails",
+    [
+        pytest.param(mock_bedrock_client, False, id="normal"),
+        pytest.param(mock_error_client, True, id="error"),
+    ],
+)
+def test_bedrock_call(
+    page_snapshot, monkeypatch, client_factory, first_call_fails
+):
+    """Bedrock API call test - The conversation ends normally, also after an error
+
+    normal: The first call returns stopReason "end_turn"
+    error: The first call raises, and the retry still ends with "end_turn"
+    """
+    from src import bedrock
+    from src.bedrock import call_bedrock_api
+    from src.browser import get_aria_snapshot
 
-    initial_elements = aria_res.get("aria_snapshot", [])
-    logging.info("Initial element count: %d", len(initial_elements))
+    logging.info(
+        "=== Bedrock call test start (first call fails: %s) ===", first_call_fails
+    )
+
+    initial_elements = page_snapshot
+    logging.debug("Initial element count: %d", len(initial_elements))
 
-    # Bedrock API call test
     success = True
-    with patch("src.bedrock.create_bedrock_client", side_effect=mock_bedrock_client):
-        messages = [{"role": "user", "content": [{"text": TEST_USER_QUERY}]}]
-        system_prompt = TEST_SYSTEM_PROMPT
-        model_id = TEST_MODEL_ID
-        tool_config = {"tools": [], "toolChoice": {"auto": {}}}
+    if client_factory is not mock_bedrock_client:
+        # Swap the module-wide patch for this test only
+        monkeypatch.setattr("src.bedrock.create_bedrock_client", client_factory)
 
-        mock_client = mock_bedrock_client()
+    mock_client = bedrock.create_bedrock_client({})
+
+    if first_call_fails:
+        # Confirm error occurs on first API call
+        try:
+            call_bedrock_api(
+                mock_client,
+                _BASE_MESSAGES,
+                TEST_SYSTEM_PROMPT,
+                TEST_MODEL_ID,
+                _TOOL_CONFIG,
+                performance_config=TEST_PERFORMANCE_CONFIG,
+            )
+            logging.error("First API call did not generate an error")
+            success = False
+        except BedrockAPIError as e:
+            logging.info("Error occurred as expected: %s", e)
 
-        # Record state before API call
-        pre_call_time = time.time()
+    # Timing is diagnostic only; skip the clock reads unless DEBUG
+    timing_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+    pre_call_ns = time.perf_counter_ns() if timing_enabled else 0
 
+    try:
         response = call_bedrock_api(
-            mock_client, messages, system_prompt, model_id, tool_config
+            mock_client,
+            _BASE_MESSAGES,
+            TEST_SYSTEM_PROMPT,
+            TEST_MODEL_ID,
+            _TOOL_CONFIG,
+            performance_config=TEST_PERFORMANCE_CONFIG,
+        )
+    except BedrockAPIError as e:
+        pytest.fail(f"Bedrock API call failed: {e}")
+
+    # Record elapsed time after API call
+    if timing_enabled:
+        logging.debug(
+            "API call duration: %d ms",
+            (time.perf_counter_ns() - pre_call_ns) // 1_000_000,
         )
 
-        # Record elapsed time after API call
-        call_duration = time.time() - pre_call_time
-        logging.info("API call duration: %.2f seconds", call_duration)
+    # performanceConfig must reach the client unchanged
+    if mock_client.last_request.get("performanceConfig") != TEST_PERFORMANCE_CONFIG:
+        logging.error(
+            "performanceConfig was not forwarded: %s",
+            mock_client.last_request.get("performanceConfig"),
+        )
+        success = False
 
-        # Verify state after API call
+    # Verify state after API call. The mocked API cannot touch the DOM, so the
+    # extra tree walk is diagnostic only
+    if _SNAPSHOT_DIAGNOSTICS:
         post_api_aria_res = get_aria_snapshot()
         if post_api_aria_res.get("status") == "success":
             post_elements = post_api_aria_res.get("aria_snapshot", [])
             logging.info("Element count after API call: %d", len(post_elements))
 
-            # Confirm DOM state hasn't changed (API call doesn't perform DOM operations)
+            # Confirm DOM state hasn't changed (API calls and errors don't touch the DOM)
             if len(initial_elements) != len(post_elements):
                 logging.warning(
                     "DOM element count changed before and after API call: %d → %d",
@@ -179,28 +335,22 @@ def test_normal_case(url=TEST_URL):
                     len(post_elements),
                 )
 
-        # Detailed response verification
-        if not verify_api_response(response):
-            logging.error("API response verification failed")
-            success = False
+    # Detailed response verification
+    if not verify_api_response(response):
+        logging.error("API response verification failed")
+        success = False
 
-        # stopReason verification (basic check)
-        if response.get("stopReason") != "end_turn":
-            logging.error(
-                "stopReason is not 'end_turn': %s", response.get("stopReason")
-            )
-            success = False
-        else:
-            stop_analysis = analyze_stop_reason(response.get("stopReason"))
-            if stop_analysis.get("should_continue"):
-                logging.error("stopReason analysis is incorrect")
-                success = False
-            elif stop_analysis.get("error"):
-                logging.error("Error detected in normal case")
-                success = False
+    # stopReason analysis (verify_api_response already checked for end_turn)
+    stop_analysis = _stop_analysis(response.get("stopReason"))
+    if stop_analysis.get("should_continue"):
+        logging.error("stopReason analysis is incorrect")
+        success = False
+    elif stop_analysis.get("error"):
+        logging.error("Error detected in stop reason analysis")
+        success = False
 
     # Log response details
-    if "response" in locals():
+    if logging.getLogger().isEnabledFor(logging.INFO):
         try:
             output = response.get("output", {})
             message = output.get("message", {})
@@ -218,257 +368,113 @@ def test_normal_case(url=TEST_URL):
             logging.warning("Error while extracting response text: %s", e)
 
     if success:
-        logging.info("Normal case test successful")
-
-    assert success, "Normal case test failed"
-
-
-def test_error_case(url=TEST_URL):  
-    """Error case test - Verify conversation API ends normally even when errors occur"""
-    logging.info("=== Error case test start ===")
-
-    # Browser initialization
-    success = True
-    init_res = initialize_browser()
-    if init_res.get("status") != "success":
-        logging.error("Browser initialization failed: %s", init_res.get("message"))
-        assert False, "Browser initialization failed"
-
-    goto_res = goto_url(url)
-    if goto_res.get("status") != "success":
-        logging.error("URL navigation failed: %s", goto_res.get("message"))
-        assert False, "URL navigation failed"
-
-    # Get initial ARIA snapshot
-    initial_aria_res = get_aria_snapshot()
-    if initial_aria_res.get("status") != "success":
-        logging.error(
-            "Initial ARIA Snapshot retrieval failed: %s", initial_aria_res.get("message")
-        )
-        assert False, "Initial ARIA Snapshot retrieval failed"
-
-    initial_elements = initial_aria_res.get("aria_snapshot", [])
-    logging.info("Initial element count: %d", len(initial_elements))
-
-    def mock_error_client(*args, **kwargs):  
-        mock_client = MagicMock()
-        mock_client.converse.side_effect = [
-            Exception("Test error"),
-            MOCK_ERROR_RESPONSE,
-        ]
-        return mock_client
-
-    # Error case API call test
-    with patch("src.bedrock.create_bedrock_client", side_effect=mock_error_client):
-        messages: list[dict[str, Any]] = [
-            {"role": "user", "content": [{"text": TEST_USER_QUERY}]}
-        ]
-        system_prompt = TEST_SYSTEM_PROMPT
-        model_id = TEST_MODEL_ID
-        tool_config = {"tools": [], "toolChoice": {"auto": {}}}
-
-        mock_client = mock_error_client()
-
-        # Confirm error occurs on first API call
-        first_error_occurred = False
-        try:
-            call_bedrock_api(
-                mock_client, messages, system_prompt, model_id, tool_config
-            )
-            logging.error("Error did not occur")
-            success = False
-        except Exception as e:  
-            first_error_occurred = True
-            logging.info("Error occurred as expected: %s", e)
-
-            # Verify DOM state after error
-            error_aria_res = get_aria_snapshot()
-            if error_aria_res.get("status") == "success":
-                error_elements = error_aria_res.get("aria_snapshot", [])
-                logging.info("Element count after error: %d", len(error_elements))
-
-                # Confirm DOM state hasn't changed due to error
-                if len(initial_elements) != len(error_elements):
-                    logging.warning(
-                        "DOM element count changed before and after error: %d → %d",
-                        len(initial_elements),
-                        len(error_elements),
-                    )
-
-            # Confirm second API call ends normally
-            try:
-                response = call_bedrock_api(
-                    mock_client, messages, system_prompt, model_id, tool_config
-                )
-
-                # Detailed response verification
-                if not verify_api_response(response):
-                    logging.error("Second API response verification failed")
-                    success = False
-
-                # Response verification
-                if response.get("stopReason") != "end_turn":
-                    logging.error(
-                        "stopReason is not 'end_turn': %s",
-                        response.get("stopReason"),
-                    )
-                    success = False
-                else:
-                    stop_analysis = analyze_stop_reason(response.get("stopReason"))
-                    if stop_analysis.get("should_continue"):
-                        logging.error("stopReason analysis is incorrect")
-                        success = False
-                    else:
-                        # Confirm recovery after error
-                        if "response" in locals():
-                            try:
-                                output = response.get("output", {})
-                                message = output.get("message", {})
-                                content = message.get("content", [])
-                                response_text = (
-                                    content[0].get("text")
-                                    if content
-                                    else "(No text)"
-                                )
-                                logging.info(
-                                    "Recovery response text: %s",
-                                    (
-                                        response_text[:100] + "..."
-                                        if len(response_text) > 100
-                                        else response_text
-                                    ),
-                                )
-
-                                # Verify recovery response is as expected
-                                if "error" in response_text.lower():
-                                    logging.info(
-                                        "Recovery response mentions error"
-                                    )
-                            except (KeyError, IndexError) as e:
-                                logging.warning(
-                                    "Error while extracting recovery response text: %s", e
-                                )
-
-                        logging.info("Recovery after error successful")
-            except Exception as e2:  
-                logging.error("Recovery after error failed: %s", e2)
-                success = False
-
-    # Confirm error actually occurred
-    if not first_error_occurred:
-        logging.error("First API call did not generate an error")
-        success = False
-
-    if success:
-        logging.info("Error case test successful")
+        logging.info("Bedrock call test successful")
 
-    assert success, "Error case test failed"
+    assert success, "Bedrock call test failed"
 
 
-def test_main_e2e(url=TEST_URL, max_turns=TEST_MAX_TURNS):
+def test_main_e2e(page_snapshot, max_turns=TEST_MAX_TURNS):
     """main.py E2E test - Emulates actual main.py processing for testing"""
-    logging.info("=== main.py E2E test start ===")
-
-    init_res = initialize_browser()
-    if init_res.get("status") != "success":
-        logging.error("Browser initialization failed: %s", init_res.get("message"))
-        assert False, "Browser initialization failed"
-
-    goto_res = goto_url(url)
-    if goto_res.get("status") != "success":
-        logging.error("URL navigation failed: %s", goto_res.get("message"))
-        assert False, "URL navigation failed"
+    from src import bedrock
+    from src.bedrock import call_bedrock_api
+    from src.browser import get_aria_snapshot
 
-    # Get initial ARIA snapshot
-    aria_res = get_aria_snapshot()
-    if aria_res.get("status") != "success":
-        logging.error("ARIA Snapshot retrieval failed: %s", aria_res.get("message"))
-        assert False, "ARIA Snapshot retrieval failed"
+    logging.info("=== main.py E2E test start ===")
 
-    initial_elements = aria_res.get("aria_snapshot", [])
-    logging.info("Initial element count: %d", len(initial_elements))
+    initial_elements = page_snapshot
+    logging.debug("Initial element count: %d", len(initial_elements))
 
     success = True
-    with patch("src.bedrock.create_bedrock_client", side_effect=mock_bedrock_client):
-        messages: list[dict[str, Any]] = [
-            {"role": "user", "content": [{"text": TEST_USER_QUERY}]}
-        ]
-        system_prompt = TEST_SYSTEM_PROMPT
-        model_id = TEST_MODEL_ID
-        tool_config = {"tools": [], "toolChoice": {"auto": {}}}
-
-        result = {
-            "status": "success",
-            "messages": messages.copy(),
-            "token_usage": {
-                "inputTokens": 0,
-                "outputTokens": 0,
-                "totalTokens": 0,
-            },
-        }
-
-        turn_count = 0
-
-        while turn_count < max_turns:
-            turn_count += 1
-            logging.info("--- Turn %d start ---", turn_count)
-
-            # Record DOM state at start of turn
-            turn_start_aria_res = get_aria_snapshot()
-            if turn_start_aria_res.get("status") == "success":
-                turn_start_elements = turn_start_aria_res.get("aria_snapshot", [])
+    messages = copy.deepcopy(_BASE_MESSAGES)
+
+    result = {
+        "status": "success",
+        "messages": messages,
+    }
+    # Token counts are accumulated in locals and stored in result after the loop
+    input_tokens = output_tokens = 0
+
+    # The mock is stateless across turns, so one client serves the whole loop
+    mock_client = bedrock.create_bedrock_client({})
+
+    turn_count = 0
+    # API timings are diagnostic only; skip the clock reads unless DEBUG
+    timing_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+    while turn_count < max_turns:
+        turn_count += 1
+        logging.info("--- Turn %d start ---", turn_count)
+
+        # Record DOM state at start of turn (the first turn starts from the
+        # snapshot the fixture already took)
+        turn_start_elements = None
+        if _SNAPSHOT_DIAGNOSTICS:
+            if turn_count == 1:
+                turn_start_elements = initial_elements
+            else:
+                turn_start_aria_res = get_aria_snapshot()
+                if turn_start_aria_res.get("status") == "success":
+                    turn_start_elements = turn_start_aria_res.get("aria_snapshot", [])
+            if turn_start_elements is not None:
                 logging.info(
-                    "Element count at start of turn %d: %d", turn_count, len(turn_start_elements)
+                    "Element count at start of turn %d: %d",
+                    turn_count,
+                    len(turn_start_elements),
                 )
 
-            try:
-                mock_client = mock_bedrock_client()
-
-                # Record time before API call
-                api_start_time = time.time()
+        try:
+            # Record time before API call
+            api_start_ns = time.perf_counter_ns() if timing_enabled else 0
+
+            response = call_bedrock_api(
+                mock_client,
+                messages,
+                TEST_SYSTEM_PROMPT,
+                TEST_MODEL_ID,
+                _TOOL_CONFIG,
+                performance_config=TEST_PERFORMANCE_CONFIG,
+            )
 
-                response = call_bedrock_api(
-                    mock_client, messages, system_prompt, model_id, tool_config
+            # Record API call duration
+            if timing_enabled:
+                logging.debug(
+                    "API call duration for turn %d: %d ms",
+                    turn_count,
+                    (time.perf_counter_ns() - api_start_ns) // 1_000_000,
                 )
 
-                # Record API call duration
-                api_duration = time.time() - api_start_time
-                logging.info(
-                    "API call duration for turn %d: %.2f seconds", turn_count, api_duration
-                )
+            usage = response.get("usage", {})
+            input_tokens += usage.get("inputTokens", 0)
+            output_tokens += usage.get("outputTokens", 0)
 
-                usage = response.get("usage", {})
-                result["token_usage"]["inputTokens"] += usage.get("inputTokens", 0)
-                result["token_usage"]["outputTokens"] += usage.get("outputTokens", 0)
-                result["token_usage"]["totalTokens"] += usage.get(
-                    "inputTokens", 0
-                ) + usage.get("outputTokens", 0)
-
-                # Detailed response verification
-                if not verify_api_response(response):
-                    logging.error(
-                        "API response verification failed for turn %d", turn_count
-                    )
-                    success = False
-
-            except Exception as e:  
-                err_msg = str(e)
-                logging.error("Bedrock API call error: %s", err_msg)
-                result["status"] = "error"
-                result["message"] = f"Bedrock API error: {err_msg}"
+            # Detailed response verification
+            if not verify_api_response(response):
+                logging.error(
+                    "API response verification failed for turn %d", turn_count
+                )
                 success = False
-                break
 
-            output = response.get("output", {})
-            message = output.get("message", {})
-            stop_reason = response.get("stopReason")
+        except Exception as e:  
+            err_msg = str(e)
+            logging.error("Bedrock API call error: %s", err_msg)
+            result["status"] = "error"
+            result["message"] = f"Bedrock API error: {err_msg}"
+            success = False
+            break
 
-            message_content = message.get("content", [])
-            messages.append({"role": "assistant", "content": message_content})
-            result["messages"].append({"role": "assistant", "content": message_content})
+        output = response.get("output", {})
+        message = output.get("message", {})
+        stop_reason = response.get("stopReason")
 
-            # Verify response message content
-            response_text = message_content[0].get("text") if message_content else ""
+        message_content = message.get("content", [])
+        # result["messages"] aliases messages, so a single append updates both
+        messages.append({"role": "assistant", "content": message_content})
+
+        # Verify response message content
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            response_text = (
+                message_content[0].get("text") if message_content else ""
+            )
             logging.info(
                 "Response text for turn %d: %s",
                 turn_count,
@@ -479,17 +485,22 @@ def test_main_e2e(url=TEST_URL, max_turns=TEST_MAX_TURNS):
                 ),
             )
 
-            stop_analysis = analyze_stop_reason(stop_reason)
+        stop_analysis = _stop_analysis(stop_reason)
 
-            # Record DOM state at end of turn and verify changes
+        # Record DOM state at end of turn and verify changes
+        if _SNAPSHOT_DIAGNOSTICS:
             turn_end_aria_res = get_aria_snapshot()
             if turn_end_aria_res.get("status") == "success":
                 turn_end_elements = turn_end_aria_res.get("aria_snapshot", [])
                 logging.info(
-                    "Element count at end of turn %d: %d", turn_count, len(turn_end_elements)
+                    "Element count at end of turn %d: %d",
+                    turn_count,
+                    len(turn_end_elements),
                 )
 
-                if len(turn_start_elements) != len(turn_end_elements):
+                if turn_start_elements is not None and len(
+                    turn_start_elements
+                ) != len(turn_end_elements):
                     logging.info(
                         "DOM element count changed during turn %d: %d → %d",
                         turn_count,
@@ -497,24 +508,31 @@ def test_main_e2e(url=TEST_URL, max_turns=TEST_MAX_TURNS):
                         len(turn_end_elements),
                     )
 
-            if not stop_analysis["should_continue"]:
-                if stop_analysis["error"]:
-                    result["status"] = "error"
-                    result["message"] = stop_analysis["message"]
-                    success = False
-                break
+        if not stop_analysis["should_continue"]:
+            if stop_analysis["error"]:
+                result["status"] = "error"
+                result["message"] = stop_analysis["message"]
+                success = False
+            break
+    else:
+        # Only reached when no turn ended the conversation
+        logging.error("Reached maximum turn count (%d)", max_turns)
+        success = False
 
-        if result["status"] != "success":
-            logging.error(
-                "E2E test failed: %s", result.get("message", "Unknown error")
-            )
-            success = False
+    result["token_usage"] = {
+        "inputTokens": input_tokens,
+        "outputTokens": output_tokens,
+        "totalTokens": input_tokens + output_tokens,
+    }
 
-        if turn_count >= max_turns:
-            logging.error("Reached maximum turn count (%d)", max_turns)
-            success = False
+    if result["status"] != "success":
+        logging.error(
+            "E2E test failed: %s", result.get("message", "Unknown error")
+        )
+        success = False
 
-        # Verify final state
+    # Verify final state
+    if _SNAPSHOT_DIAGNOSTICS:
         final_aria_res = get_aria_snapshot()
         if final_aria_res.get("status") == "success":
             final_elements = final_aria_res.get("aria_snapshot", [])
@@ -527,80 +545,90 @@ def test_main_e2e(url=TEST_URL, max_turns=TEST_MAX_TURNS):
                     len(final_elements),
                 )
 
-        # Check token usage
-        logging.info(
-            "Token usage: input=%d, output=%d, total=%d",
-            result["token_usage"]["inputTokens"],
-            result["token_usage"]["outputTokens"],
-            result["token_usage"]["totalTokens"],
-        )
-
-        if success:
-            logging.info("E2E test successful: ended normally after %d turns", turn_count)
+    # Check token usage
+    logging.info(
+        "Token usage: input=%d, output=%d, total=%d",
+        result["token_usage"]["inputTokens"],
+        result["token_usage"]["outputTokens"],
+        result["token_usage"]["totalTokens"],
+    )
 
-    cleanup_browser()
+    if success:
+        logging.info("E2E test successful: ended normally after %d turns", turn_count)
 
     assert success, "E2E test failed"
 
 
+def parse_args() -> tuple[argparse.Namespace, list[str]]:
+    """Parse command line arguments
+
+    Unrecognized arguments are returned as-is so they can be passed on to pytest.
+    """
+    parser = argparse.ArgumentParser(description="main.py E2E test")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run the test cases over xdist workers",
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run the test cases in a single process even with RUN_INTEGRATION=1",
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Enable DEBUG logging (API timings)",
+    )
+    return parser.parse_known_args()
+
+
 def main():
-    """Main function - Controls test execution"""
-    # Apply test settings
-    url = TEST_URL
-    timeout = TEST_TIMEOUT
+    """Main function - Runs the test cases in this file through pytest"""
+    args, pytest_extra_args = parse_args()
 
     setup_logging()
-    # Always set log level to DEBUG
-    logging.getLogger().setLevel(logging.DEBUG)
+    pytest_args = [__file__, "-q", *pytest_extra_args]
+    if _RUN_INTEGRATION:
+        # The real browser fixtures are only set up with --e2e
+        pytest_args.append("--e2e")
+    if args.debug or os.environ.get("DEBUG_TESTS") == "1":
+        logging.getLogger().setLevel(logging.DEBUG)
+        # Also applies inside xdist workers, which configure their own logging
+        pytest_args.append("--log-level=DEBUG")
+    # Worker start-up costs more than the mocked cases themselves; it only
+    # pays off when every case drives a real browser
+    parallel = args.parallel or (_RUN_INTEGRATION and not args.serial)
+    if parallel and importlib.util.find_spec("xdist") is None:
+        logging.warning("pytest-xdist is not installed. Running sequentially.")
+        parallel = False
+    if parallel:
+        # Each worker process owns its own browser (see conftest.py)
+        pytest_args += ["-n", "auto", "--dist=load"]
 
     logging.info(
-        "main.py E2E test start: headless=%s, CI=%s",
+        "main.py E2E test start: headless=%s, CI=%s, parallel=%s",
         os.environ.get("HEADLESS", "false"),
         os.environ.get("CI", "false"),
+        parallel,
     )
 
     start_time = time.time()
 
     try:
-        # Run test functions and evaluate assertions as needed
-        try:
-            test_normal_case()  # Don't use return value
-            normal_success = True
-        except AssertionError:
-            normal_success = False
-
-        try:
-            test_error_case()  # Don't use return value
-            error_success = True
-        except AssertionError:
-            error_success = False
-
-        try:
-            test_main_e2e()  # Don't use return value
-            e2e_success = True
-        except AssertionError:
-            e2e_success = False
+        exit_code = int(pytest.main(pytest_args))
 
         elapsed_time = time.time() - start_time
         logging.info("Test execution time: %.2f seconds", elapsed_time)
 
-        if normal_success and error_success and e2e_success:
+        if exit_code == 0:
             logging.info("All tests passed successfully")
-            return 0
-
-        logging.error("Some tests failed")
-        return 1
+        else:
+            logging.error("Some tests failed")
+        return exit_code
     except Exception as e:  
-        logging.error("Error during test execution: %s", e)
-        traceback.print_exc()
+        logging.exception("Error during test execution: %s", e)
         return 1
-    finally:
-        try:
-            cleanup_browser()
-            logging.info("Browser cleanup completed")
-        except Exception as e:  
-            logging.error("Error during browser cleanup: %s", e)
-            traceback.print_exc()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+"""Token usage accounting tests
+
+Checks that ``update_token_usage`` accumulates the per-turn usage reported by
+the Bedrock API into the running totals.
+"""
+
+
+def _new_token_usage() -> dict[str, int]:
+    return {"inputTokens": 0, "outputTokens": 0, "totalTokens": 0}
+
+
+def test_update_token_usage_accumulates_in_place():
+    """Usage is added to the passed dict itself, across several turns"""
+    # Imported here so that collection does not load boto3
+    from src.bedrock import update_token_usage
+
+    token_usage = _new_token_usage()
+    response = {"usage": {"inputTokens": 100, "outputTokens": 50, "totalTokens": 150}}
+
+    result = update_token_usage(response, token_usage)
+    assert result is token_usage
+    assert token_usage["inputTokens"] == 100
+    assert token_usage["outputTokens"] == 50
+
+    update_token_usage({"usage": {"inputTokens": 50, "outputTokens": 25}}, token_usage)
+    assert token_usage["inputTokens"] == 150
+    assert token_usage["outputTokens"] == 75
+
+
+def test_update_token_usage_derives_total():
+    """totalTokens follows the running totals, ignoring the reported totalTokens"""
+    from src.bedrock import update_token_usage
+
+    token_usage = {"inputTokens": 10, "outputTokens": 5, "totalTokens": 999}
+    update_token_usage(
+        {"usage": {"inputTokens": 1, "outputTokens": 2, "totalTokens": 0}},
+        token_usage,
+    )
+    assert token_usage == {"inputTokens": 11, "outputTokens": 7, "totalTokens": 18}
+
+
+def test_update_token_usage_without_usage():
+    """A missing or null usage field leaves the counts unchanged"""
+    from src.bedrock import update_token_usage
+
+    token_usage = {"inputTokens": 3, "outputTokens": 4, "totalTokens": 7}
+    update_token_usage({"usage": None}, token_usage)
+    update_token_usage({}, token_usage)
+    assert token_usage == {"inputTokens": 3, "outputTokens": 4, "totalTokens": 7}